@@ -56,9 +56,7 @@ object Main {
         println(Output.initResultMessage(result))
         ExitCode.Success
       case Failure(exception) =>
-        System.err.println(s"Initialization failed: ${exception.getMessage}")
-        exception.printStackTrace()
-        ExitCode.Error
+        commandFailed("Initialization", exception)
     }
   }
 
@@ -82,9 +80,7 @@ object Main {
         if (result.successful) ExitCode.Success
         else ExitCode.Error
       case Failure(exception) =>
-        System.err.println(s"Generation failed: ${exception.getMessage}")
-        exception.printStackTrace()
-        ExitCode.Error
+        commandFailed("Generation", exception)
     }
   }
 
@@ -107,9 +103,7 @@ object Main {
         if (result.successful) ExitCode.Success
         else ExitCode.Error
       case Failure(exception) =>
-        System.err.println(s"Check failed: ${exception.getMessage}")
-        exception.printStackTrace()
-        ExitCode.Error
+        commandFailed("Check", exception)
     }
   }
 
@@ -139,6 +133,13 @@ object Main {
     }
   }
 
+  /** Reports an unexpected failure from one of the devenv commands. */
+  private def commandFailed(action: String, exception: Throwable): ExitCode = {
+    System.err.println(s"$action failed: ${exception.getMessage}")
+    exception.printStackTrace()
+    ExitCode.Error
+  }
+
   private def printUsage(): Unit = {
     val header = s"${Bold.On("Usage:")} devenv <command>"
     // devenv commands
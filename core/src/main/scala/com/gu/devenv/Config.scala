@@ -11,16 +11,30 @@ import io.circe.yaml.scalayaml.parser
 import io.circe.generic.extras.Configuration
 import io.circe.generic.extras.auto.*
 
-import java.nio.file.Path
+import java.nio.file.{FileSystemException, Files, NoSuchFileException, NotDirectoryException, Path}
 
 object Config {
   given Configuration = Configuration.default.withDefaults
 
-  def loadProjectConfig(path: Path): Try[ProjectConfig] =
-    for {
-      configStr <- Filesystem.readFile(path)
-      config    <- parseProjectConfig(configStr)
-    } yield config
+  /** Loads the project's config file, or None if it does not exist (i.e. the project has not been
+    * initialized). This includes the case where the config's directory is not a directory at all.
+    *
+    * We read the file directly rather than checking for its existence first, so there is a single
+    * filesystem operation per load.
+    */
+  def loadProjectConfig(path: Path): Try[Option[ProjectConfig]] =
+    Filesystem
+      .readFile(path)
+      .flatMap(parseProjectConfig)
+      .map(Some(_))
+      .recover {
+        case _: NoSuchFileException | _: NotDirectoryException =>
+          None
+        // reading through a file as if it were a directory fails with ENOTDIR, which is reported
+        // as a plain FileSystemException
+        case _: FileSystemException if Option(path.getParent).exists(!Files.isDirectory(_)) =>
+          None
+      }
 
   def loadUserConfig(path: Path): Try[Option[UserConfig]] =
     Filesystem
@@ -185,10 +199,10 @@ object Config {
     * result in an empty configuration. We check for empty contents here.
     */
   private def yamlIsEmpty(text: String): Boolean =
-    text.linesIterator
-      .map(_.trim)
-      .filter(_.nonEmpty)
-      .forall(_.startsWith("#"))
+    text.linesIterator.forall { line =>
+      val trimmed = line.trim
+      trimmed.isEmpty || trimmed.startsWith("#")
+    }
 
   private def applyPlugins(
       projectPlugins: Plugins,
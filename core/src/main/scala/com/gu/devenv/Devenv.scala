@@ -1,6 +1,7 @@
 package com.gu.devenv
 
 import cats.*
+import cats.data.EitherT
 import com.gu.devenv.Filesystem.PLACEHOLDER_PROJECT_NAME
 
 import java.nio.file.Path
@@ -55,21 +56,13 @@ object Devenv {
     val userPaths   = Filesystem.resolveUserConfigPaths(userConfigPath)
 
     for {
-      // stop if the devenv directory does not exist
-      _ <- exitIf(
-        !java.nio.file.Files.exists(devEnvPaths.devenvFile),
-        GenerateResult.NotInitialized
+      (userJson, sharedJson) <- renderConfigs(
+        devEnvPaths,
+        userPaths,
+        modules,
+        notInitialized = GenerateResult.NotInitialized,
+        notCustomized = GenerateResult.ConfigNotCustomized
       )
-      projectConfig <- Config.loadProjectConfig(devEnvPaths.devenvFile).liftF
-      // stop if the project config has not been configured
-      _ <- exitIf(
-        projectConfig.name == PLACEHOLDER_PROJECT_NAME,
-        GenerateResult.ConfigNotCustomized
-      )
-      maybeUserConfig <- Config.loadUserConfig(userPaths.devenvConf).liftF
-      (userJson, sharedJson) <- Config
-        .generateConfigs(projectConfig, maybeUserConfig, modules)
-        .liftF
       userDevcontainerStatus <- Filesystem
         .updateFile(devEnvPaths.userDevcontainerFile, userJson)
         .liftF
@@ -100,25 +93,13 @@ object Devenv {
     val userPaths   = Filesystem.resolveUserConfigPaths(userConfigPath)
 
     for {
-      // stop if the devenv directory does not exist
-      _ <- exitIf(
-        !java.nio.file.Files.exists(devEnvPaths.devenvFile),
-        CheckResult.NotInitialized
-      )
-      projectConfig <- Config.loadProjectConfig(devEnvPaths.devenvFile).liftF
-      // stop if the project config has not been configured
-      _ <- exitIf(
-        projectConfig.name == PLACEHOLDER_PROJECT_NAME,
-        CheckResult.NotInitialized
+      (expectedUserJson, expectedSharedJson) <- renderConfigs(
+        devEnvPaths,
+        userPaths,
+        modules,
+        notInitialized = CheckResult.NotInitialized,
+        notCustomized = CheckResult.NotInitialized
       )
-      maybeUserConfig <- Config.loadUserConfig(userPaths.devenvConf).liftF
-      (expectedUserJson, expectedSharedJson) <- Config
-        .generateConfigs(
-          projectConfig,
-          maybeUserConfig,
-          modules
-        )
-        .liftF
       actualUserJson <- Filesystem
         .readFile(devEnvPaths.userDevcontainerFile)
         .recover { case _ => "" }
@@ -135,4 +116,31 @@ object Devenv {
       devcontainerDir
     )
   }
+
+  /** Loads the project and user configurations and renders the user and shared devcontainer.json
+    * contents, exiting early with the provided results if the project has not been set up.
+    *
+    * This is the common first half of generate and check.
+    */
+  private def renderConfigs[Res](
+      devEnvPaths: DevEnvPaths,
+      userPaths: UserConfigPaths,
+      modules: List[Module],
+      notInitialized: Res,
+      notCustomized: Res
+  ): EitherT[Try, Res, (String, String)] =
+    for {
+      maybeProjectConfig <- Config.loadProjectConfig(devEnvPaths.devenvFile).liftF
+      // stop if the devenv file does not exist
+      projectConfig <- exitIfEmpty(maybeProjectConfig, notInitialized)
+      // stop if the project config has not been configured
+      _ <- exitIf(
+        projectConfig.name == PLACEHOLDER_PROJECT_NAME,
+        notCustomized
+      )
+      maybeUserConfig <- Config.loadUserConfig(userPaths.devenvConf).liftF
+      configs <- Config
+        .generateConfigs(projectConfig, maybeUserConfig, modules)
+        .liftF
+    } yield configs
 }
@@ -1,7 +1,14 @@
 package com.gu.devenv
 
-import java.nio.file.{Files, Path, StandardOpenOption}
-import scala.jdk.CollectionConverters.given
+import java.nio.file.{
+  FileAlreadyExistsException,
+  Files,
+  Path,
+  StandardCopyOption,
+  StandardOpenOption
+}
+import java.nio.file.attribute.PosixFileAttributeView
+import java.util.UUID
 import scala.util.Try
 import com.gu.devenv.modules.Modules.Module
 
@@ -27,14 +34,19 @@ object Filesystem {
       devenvConf = root.resolve("devenv.yaml")
     )
 
-  def createDirIfNotExists(dir: Path): Try[FileSystemStatus] = Try {
-    if (!Files.exists(dir)) {
+  /** Creates the directory if it does not already exist.
+    *
+    * We attempt the creation directly and treat "already exists" as a result, rather than checking
+    * first. This saves a filesystem call and avoids a race between the check and the creation.
+    * `setupGitignore` and `setupDevenv` do the same for files, by writing with `CREATE_NEW`.
+    */
+  def createDirIfNotExists(dir: Path): Try[FileSystemStatus] =
+    Try {
       Files.createDirectory(dir)
       FileSystemStatus.Created
-    } else {
+    }.recover { case _: FileAlreadyExistsException =>
       FileSystemStatus.AlreadyExists
     }
-  }
 
   def readFile(path: Path): Try[String] = Try {
     val bytes = Files.readAllBytes(path)
@@ -42,66 +54,83 @@ object Filesystem {
   }
 
   /** Updates a file by overwriting its content, or creates it if it doesn't exist.
+    *
+    * The new content is written to a uniquely named temporary file alongside the target, which is
+    * then moved into place. This means anything reading the file (e.g. an IDE watching
+    * devcontainer.json) never sees a partially written file, and overlapping runs don't clobber
+    * each other's temporary files. An existing file keeps its permissions. If the path is a
+    * symlink, the file it points to is replaced and the link is left in place.
     *
     * Use this for files that should be regenerated on each run (e.g., devcontainer.json). Do NOT
     * use this for init behavior where existing files should be preserved.
     */
   def updateFile(path: Path, content: String): Try[FileSystemStatus] = Try {
     val exists = Files.exists(path)
+    val target = if (exists && Files.isSymbolicLink(path)) path.toRealPath() else path
     // Create parent directories if they don't exist
-    Option(path.getParent).foreach(Files.createDirectories(_))
-    Files.write(
-      path,
-      content.getBytes(java.nio.charset.StandardCharsets.UTF_8),
-      StandardOpenOption.CREATE,
-      StandardOpenOption.TRUNCATE_EXISTING
-    )
+    Option(target.getParent).foreach(Files.createDirectories(_))
+    val tempFile = target.resolveSibling(s".${target.getFileName}.${UUID.randomUUID()}.tmp")
+    try {
+      // a plain write, so new files get the user's default (umask) permissions
+      Files.write(
+        tempFile,
+        content.getBytes(java.nio.charset.StandardCharsets.UTF_8),
+        StandardOpenOption.CREATE_NEW,
+        StandardOpenOption.WRITE
+      )
+      if (exists) {
+        Option(Files.getFileAttributeView(target, classOf[PosixFileAttributeView])).foreach {
+          view => Files.setPosixFilePermissions(tempFile, view.readAttributes().permissions())
+        }
+      }
+      Files.move(tempFile, target, StandardCopyOption.ATOMIC_MOVE)
+    } finally Files.deleteIfExists(tempFile): Unit
     if (exists) FileSystemStatus.AlreadyExists else FileSystemStatus.Created
   }
 
-  def setupGitignore(gitignoreFile: Path): Try[GitignoreStatus] = Try {
-    if (!Files.exists(gitignoreFile)) {
+  def setupGitignore(gitignoreFile: Path): Try[GitignoreStatus] =
+    Try {
       Files.write(
         gitignoreFile,
         gitignoreContents.getBytes,
         StandardOpenOption.CREATE_NEW
       )
       GitignoreStatus.Created
-    } else {
-      // check if the .gitignore file already includes the `user/` entry we want to add
-      val hasUserExclusion = Files
-        .lines(gitignoreFile)
-        .iterator()
-        .asScala
-        .map(_.trim)
-        .contains("user/")
+    }.recoverWith { case _: FileAlreadyExistsException =>
+      Try {
+        // check if the .gitignore file already includes the `user/` entry we want to add
+        // (the file is small, so we read it in one go rather than streaming its lines)
+        val hasUserExclusion = Files
+          .readString(gitignoreFile)
+          .linesIterator
+          .map(_.trim)
+          .contains("user/")
 
-      if (hasUserExclusion) {
-        GitignoreStatus.AlreadyExistsWithExclusion
-      } else {
-        // Append our comment and user/ entry to the existing file
-        Files.write(
-          gitignoreFile,
-          gitignoreContents.getBytes,
-          StandardOpenOption.APPEND
-        )
-        GitignoreStatus.Updated
+        if (hasUserExclusion) {
+          GitignoreStatus.AlreadyExistsWithExclusion
+        } else {
+          // Append our comment and user/ entry to the existing file
+          Files.write(
+            gitignoreFile,
+            gitignoreContents.getBytes,
+            StandardOpenOption.APPEND
+          )
+          GitignoreStatus.Updated
+        }
       }
     }
-  }
 
-  def setupDevenv(devenvFile: Path, modules: List[Module]): Try[FileSystemStatus] = Try {
-    if (!Files.exists(devenvFile)) {
+  def setupDevenv(devenvFile: Path, modules: List[Module]): Try[FileSystemStatus] =
+    Try {
       Files.write(
         devenvFile,
         devenvContents(modules).getBytes,
         StandardOpenOption.CREATE_NEW
       )
       FileSystemStatus.Created
-    } else {
+    }.recover { case _: FileAlreadyExistsException =>
       FileSystemStatus.AlreadyExists
     }
-  }
 
   private val gitignoreContents =
     """|# User-specific devcontainer directory with merged personal preferences
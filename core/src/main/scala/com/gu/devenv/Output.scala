@@ -97,7 +97,7 @@ object Output {
 
   private def buildNotInitializedMessage(): String = {
     val header  = Bold.On(Color.Red("Project not initialized"))
-    val divider = Color.Red("━" * 60)
+    val divider = Color.Red(dividerLine)
 
     s"""$header
        |$divider
@@ -113,7 +113,7 @@ object Output {
 
   private def buildConfigNotCustomizedMessage(): String = {
     val header  = Bold.On(Color.Yellow("Configuration not customized"))
-    val divider = Color.Yellow("━" * 60)
+    val divider = Color.Yellow(dividerLine)
 
     s"""$header
        |$divider
@@ -138,7 +138,7 @@ object Output {
 
   private def buildCheckMatchMessage(userPath: String, sharedPath: String): String = {
     val header  = Bold.On(Color.Green("✓ Configuration is up-to-date"))
-    val divider = Color.Green("━" * 60)
+    val divider = Color.Green(dividerLine)
 
     s"""$header
        |$divider
@@ -156,7 +156,7 @@ object Output {
       sharedPath: String
   ): String = {
     val header  = Bold.On(Color.Red("✗ Configuration is out-of-date"))
-    val divider = Color.Red("━" * 60)
+    val divider = Color.Red(dividerLine)
 
     val mismatchedFiles = List(
       userMismatch.map(diff => s"  ✗ ${Color.Cyan(diff.path)}"),
@@ -190,6 +190,8 @@ object Output {
       )} to update the devcontainer files.""".stripMargin
   }
 
+  private val dividerLine = "━" * 60
+
   // Shared table builder (called by buildInitTable and buildGenerateTable)
 
   private def buildTable(
@@ -198,7 +200,7 @@ object Output {
       pathPadding: Int
   ): String = {
     val header  = Bold.On(title)
-    val divider = Color.LightBlue("━" * 60)
+    val divider = Color.LightBlue(dividerLine)
 
     val tableRows = rows
       .map { case (path, (emoji, text, colorFn)) =>
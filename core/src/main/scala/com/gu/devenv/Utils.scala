@@ -14,6 +14,7 @@ import scala.util.Try
   * Usage:
   *   - Use [[withConditions]] to wrap a for-comprehension that may exit early
   *   - Use [[exitIf]] to exit early with a result value if a condition is met
+  *   - Use [[exitIfEmpty]] to exit early with a result value if an optional value is missing
   *   - Add a [[liftF]] suffix to normal Try-returning operations so they can be used alongside
   *     exitIf checks.
   *
@@ -45,6 +46,15 @@ object Utils {
     else
       EitherT.rightT(())
 
+  /** A helper for exiting early from a for-comprehension with a result value if an optional value is
+    * empty. Otherwise, the for-comprehension continues with the contained value.
+    */
+  def exitIfEmpty[Res, A](maybeA: Option[A], result: Res): EitherT[Try, Res, A] =
+    maybeA match {
+      case Some(a) => EitherT.rightT(a)
+      case None    => EitherT.leftT(result)
+    }
+
   /** Alias liftF onto Try, so we don't need to write EitherT.liftF up front on every step.
     *
     * This way round we have the step's intent up front, and its conversion to EitherT at the end of
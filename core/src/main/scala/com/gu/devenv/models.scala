@@ -6,7 +6,6 @@ import cats.syntax.all.*
 import com.gu.devenv.Filesystem.{FileSystemStatus, GitignoreStatus}
 
 import java.nio.file.Path
-import scala.util.Try
 
 case class ProjectConfig(
     name: String,
@@ -58,13 +57,13 @@ object ForwardPort {
       portString.split(":") match {
         case Array(hostPortStr, containerPortStr) =>
           for {
-            hostPort <- Try(hostPortStr.toInt).toEither.leftMap(_ =>
+            hostPort <- hostPortStr.toIntOption.toRight(
               DecodingFailure(
                 s"Invalid host port: $hostPortStr",
                 c.history
               )
             )
-            containerPort <- Try(containerPortStr.toInt).toEither.leftMap(_ =>
+            containerPort <- containerPortStr.toIntOption.toRight(
               DecodingFailure(
                 s"Invalid container port: $containerPortStr",
                 c.history
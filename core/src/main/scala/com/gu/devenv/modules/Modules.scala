@@ -33,13 +33,41 @@ object Modules {
     * precedence over module defaults. Returns a Failure if any unknown modules are specified.
     */
   def applyModules(config: ProjectConfig, modules: List[Module]): Try[ProjectConfig] =
-    config.modules
-      .traverse(getModuleContribution(modules)) // lookup requested modules to check we support them
-      .map { moduleContributions =>
-        moduleContributions.foldRight(config)((contribution, cfg) =>
-          applyModuleContribution(cfg, contribution)
-        )
-      }
+    if (config.modules.isEmpty) {
+      // nothing to apply, so no need to index the available modules
+      Success(config)
+    } else {
+      // index the available modules once, rather than searching the list for each requested module
+      // (reversed so that the first module with a given name wins, as it would with a linear search)
+      val modulesByName = modules.reverseIterator.map(module => module.name -> module).toMap
+      config.modules
+        // lookup requested modules to check we support them
+        .traverse(getModuleContribution(modulesByName))
+        .map { moduleContributions =>
+          // combine the modules first, so the config itself is only rebuilt once
+          applyModuleContribution(config, combineContributions(moduleContributions))
+        }
+    }
+
+  /** Combine several module contributions into one, keeping the modules' order. This has the same
+    * effect as applying each contribution to the config in turn.
+    */
+  private[devenv] def combineContributions(
+      contributions: List[ModuleContribution]
+  ): ModuleContribution =
+    ModuleContribution(
+      features = contributions.foldLeft(Map.empty[String, Json])(_ ++ _.features),
+      mounts = contributions.flatMap(_.mounts),
+      plugins = Plugins(
+        intellij = contributions.flatMap(_.plugins.intellij),
+        vscode = contributions.flatMap(_.plugins.vscode)
+      ),
+      containerEnv = contributions.flatMap(_.containerEnv),
+      remoteEnv = contributions.flatMap(_.remoteEnv),
+      postCreateCommands = contributions.flatMap(_.postCreateCommands),
+      capAdd = contributions.flatMap(_.capAdd),
+      securityOpt = contributions.flatMap(_.securityOpt)
+    )
 
   /** Apply a single module contribution to a project config. Module contributions are prepended to
     * explicit config, so explicit config takes precedence.
@@ -62,10 +90,10 @@ object Modules {
       securityOpt = contribution.securityOpt ++ config.securityOpt
     )
 
-  private def getModuleContribution(modules: List[Module])(
+  private def getModuleContribution(modulesByName: Map[String, Module])(
       moduleName: String
   ): Try[ModuleContribution] =
-    modules.find(_.name == moduleName) match {
+    modulesByName.get(moduleName) match {
       case Some(module) => Success(module.contribution)
       case None         => Failure(new IllegalArgumentException(s"Unknown module: '$moduleName'"))
     }
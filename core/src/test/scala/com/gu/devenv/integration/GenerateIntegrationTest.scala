@@ -11,6 +11,9 @@ import org.scalatest.freespec.AnyFreeSpec
 import org.scalatest.matchers.should.Matchers
 
 import java.nio.file.Files
+import java.nio.file.attribute.PosixFilePermissions
+import scala.jdk.CollectionConverters._
+import scala.util.Using
 
 class GenerateIntegrationTest extends AnyFreeSpec with Matchers with TryValues {
   private val modules: List[com.gu.devenv.modules.Modules.Module] = builtInModules
@@ -32,6 +35,16 @@ class GenerateIntegrationTest extends AnyFreeSpec with Matchers with TryValues {
 
         Files.exists(devcontainerDir) shouldBe false
       }
+
+      "should return NotInitialized when .devcontainer is not a directory" in withTempDirs {
+        (tempDir, userConfigDir) =>
+          val devcontainerDir = tempDir.resolve(".devcontainer")
+          Files.writeString(devcontainerDir, "not a directory")
+
+          val result = Devenv.generate(devcontainerDir, userConfigDir, modules).success.value
+
+          result shouldBe GenerateResult.NotInitialized
+      }
     }
 
     "generating with placeholder project name" - {
@@ -141,6 +154,72 @@ class GenerateIntegrationTest extends AnyFreeSpec with Matchers with TryValues {
           secondUserJson should not include "My Test Project"
           firstUserJson should not equal secondUserJson
       }
+
+      "should replace existing files without leaving temporary files behind" in withTempDirs {
+        (tempDir, userConfigDir) =>
+          val devcontainerDir = tempDir.resolve(".devcontainer")
+
+          Devenv.init(devcontainerDir, modules).success.value
+          Files.writeString(devcontainerDir.resolve("devenv.yaml"), basicProjectConfig)
+          Files.writeString(devcontainerDir.resolve("user/devcontainer.json"), "stale")
+          Files.writeString(devcontainerDir.resolve("shared/devcontainer.json"), "stale")
+
+          val result = Devenv.generate(devcontainerDir, userConfigDir, modules).success.value
+
+          result match {
+            case GenerateResult.Success(userStatus, sharedStatus) =>
+              userStatus shouldBe FileSystemStatus.AlreadyExists
+              sharedStatus shouldBe FileSystemStatus.AlreadyExists
+            case _ => fail("Expected Success result")
+          }
+
+          Files.readString(devcontainerDir.resolve("user/devcontainer.json")) should include(
+            "\"My Test Project\""
+          )
+          Files.readString(devcontainerDir.resolve("shared/devcontainer.json")) should include(
+            "\"My Test Project\""
+          )
+          for (dir <- List("user", "shared")) {
+            val fileNames = Using.resource(Files.list(devcontainerDir.resolve(dir))) { files =>
+              files.iterator().asScala.map(_.getFileName.toString).toList
+            }
+            fileNames shouldBe List("devcontainer.json")
+          }
+      }
+
+      "should regenerate through a symlinked devcontainer.json" in withTempDirs {
+        (tempDir, userConfigDir) =>
+          val devcontainerDir = tempDir.resolve(".devcontainer")
+
+          Devenv.init(devcontainerDir, modules).success.value
+          Files.writeString(devcontainerDir.resolve("devenv.yaml"), basicProjectConfig)
+          val linkedFile = Files.writeString(tempDir.resolve("linked-devcontainer.json"), "stale")
+          val link       = devcontainerDir.resolve("shared/devcontainer.json")
+          Files.createSymbolicLink(link, linkedFile)
+
+          Devenv.generate(devcontainerDir, userConfigDir, modules).success.value
+
+          Files.isSymbolicLink(link) shouldBe true
+          Files.readSymbolicLink(link) shouldBe linkedFile
+          Files.readString(linkedFile) should include("\"My Test Project\"")
+      }
+
+      "should keep the permissions of an existing devcontainer.json" in withTempDirs {
+        (tempDir, userConfigDir) =>
+          val devcontainerDir = tempDir.resolve(".devcontainer")
+
+          Devenv.init(devcontainerDir, modules).success.value
+          Files.writeString(devcontainerDir.resolve("devenv.yaml"), basicProjectConfig)
+          val sharedFile  = devcontainerDir.resolve("shared/devcontainer.json")
+          val permissions = PosixFilePermissions.fromString("rw-rw----")
+          Files.writeString(sharedFile, "stale")
+          Files.setPosixFilePermissions(sharedFile, permissions)
+
+          Devenv.generate(devcontainerDir, userConfigDir, modules).success.value
+
+          Files.readString(sharedFile) should include("\"My Test Project\"")
+          Files.getPosixFilePermissions(sharedFile) shouldBe permissions
+      }
     }
 
     "generating a project config merged with a user config" - {
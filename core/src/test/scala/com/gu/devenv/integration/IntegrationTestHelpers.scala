@@ -2,6 +2,7 @@ package com.gu.devenv.integration
 
 import java.nio.file.{Files, Path}
 import scala.jdk.CollectionConverters._
+import scala.util.Using
 
 object IntegrationTestHelpers {
   // Helper functions for temporary directory management
@@ -26,7 +27,8 @@ object IntegrationTestHelpers {
 
   private def deleteRecursively(path: Path): Unit = {
     if (Files.isDirectory(path)) {
-      Files.list(path).iterator().asScala.foreach(deleteRecursively)
+      // close the directory stream once we're done with it
+      Using.resource(Files.list(path))(_.iterator().asScala.foreach(deleteRecursively))
     }
     Files.delete(path)
   }
@@ -1,15 +1,108 @@
 package com.gu.devenv.modules
 
 import com.gu.devenv.*
-import com.gu.devenv.modules.Modules.ModuleContribution
+import com.gu.devenv.modules.Modules.{Module, ModuleContribution}
 import io.circe.Json
 import org.scalacheck.Gen
 import org.scalatestplus.scalacheck.ScalaCheckPropertyChecks
 import org.scalatest.freespec.AnyFreeSpec
 import org.scalatest.matchers.should.Matchers
 
+import scala.util.Success
+
 class ModulesTest extends AnyFreeSpec with Matchers with ScalaCheckPropertyChecks {
 
+  "Modules.applyModules" - {
+    "returns the config unchanged when no modules are requested" in {
+      val config = ProjectConfig(name = "test", modules = Nil)
+
+      Modules.applyModules(config, Modules.builtInModules) shouldBe Success(config)
+    }
+
+    "applies modules in order, with explicit config after all module contributions" in {
+      val first = Module(
+        name = "first",
+        summary = "first module",
+        enabledByDefault = false,
+        contribution = ModuleContribution(
+          features = Map("feature" -> Json.fromString("first")),
+          mounts = List(Mount.ShortMount("first-mount")),
+          postCreateCommands = List(Command("first-cmd", "."))
+        )
+      )
+      val second = Module(
+        name = "second",
+        summary = "second module",
+        enabledByDefault = false,
+        contribution = ModuleContribution(
+          features = Map("feature" -> Json.fromString("second")),
+          mounts = List(Mount.ShortMount("second-mount")),
+          postCreateCommands = List(Command("second-cmd", "."))
+        )
+      )
+      val config = ProjectConfig(
+        name = "test",
+        modules = List("first", "second"),
+        mounts = List(Mount.ShortMount("explicit-mount")),
+        postCreateCommand = List(Command("explicit-cmd", "."))
+      )
+
+      val result = Modules.applyModules(config, List(first, second)).get
+
+      result.mounts shouldBe List(
+        Mount.ShortMount("first-mount"),
+        Mount.ShortMount("second-mount"),
+        Mount.ShortMount("explicit-mount")
+      )
+      result.postCreateCommand.map(_.cmd) shouldBe List("first-cmd", "second-cmd", "explicit-cmd")
+      // later modules take precedence over earlier ones for the same feature
+      result.features("feature") shouldBe Json.fromString("second")
+    }
+
+    "combining contributions is equivalent to applying them one at a time" in {
+      val genName = Gen.alphaNumStr.suchThat(_.nonEmpty)
+      val genEnv  = Gen.zip(genName, Gen.alphaNumStr).map(Env(_, _))
+      val genContribution: Gen[ModuleContribution] = for {
+        features     <- Gen.mapOf(Gen.zip(genName, Gen.alphaNumStr.map(Json.fromString)))
+        mounts       <- Gen.listOf(genName.map(Mount.ShortMount(_)))
+        intellij     <- Gen.listOf(genName)
+        vscode       <- Gen.listOf(genName)
+        containerEnv <- Gen.listOf(genEnv)
+        remoteEnv    <- Gen.listOf(genEnv)
+        commands     <- Gen.listOf(genName.map(Command(_, ".")))
+        capAdd       <- Gen.listOf(genName)
+        securityOpt  <- Gen.listOf(genName)
+      } yield ModuleContribution(
+        features = features,
+        mounts = mounts,
+        plugins = Plugins(intellij = intellij, vscode = vscode),
+        containerEnv = containerEnv,
+        remoteEnv = remoteEnv,
+        postCreateCommands = commands,
+        capAdd = capAdd,
+        securityOpt = securityOpt
+      )
+
+      forAll(Gen.listOf(genContribution)) { contributions =>
+        val config = ProjectConfig(name = "test")
+
+        val oneAtATime = contributions.foldRight(config)((contribution, cfg) =>
+          Modules.applyModuleContribution(cfg, contribution)
+        )
+        val combined =
+          Modules.applyModuleContribution(config, Modules.combineContributions(contributions))
+
+        combined shouldBe oneAtATime
+      }
+    }
+
+    "fails for unknown modules" in {
+      val config = ProjectConfig(name = "test", modules = List("unknown-module"))
+
+      Modules.applyModules(config, Modules.builtInModules).isFailure shouldBe true
+    }
+  }
+
   "Modules.applyModuleContribution" - {
 
     "features field" - {
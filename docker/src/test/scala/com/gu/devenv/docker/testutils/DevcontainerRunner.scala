@@ -21,16 +21,21 @@ class DevcontainerRunner(workspaceDir: Path) {
   // causes incomplete workspace mounting on CI environments (e.g., GHA).
   private val noGitRoot = "--mount-workspace-git-root=false"
 
+  // `devcontainer up` reports the container ID in its JSON result, so we keep it for cleanup
+  private val containerIdPattern = """"containerId"\s*:\s*"([^"]+)"""".r
+  private var containerId: Option[String] = None
+
   /** Builds the devcontainer image */
   def build(): CommandResult =
     CommandRunner.run(s"$devcontainer build --workspace-folder $workspacePath --config $configPath")
 
-  /** Starts the devcontainer and returns its ID */
+  /** Starts the devcontainer and records its ID */
   def up(): Either[String, Unit] = {
     val result = CommandRunner.run(
       s"$devcontainer up --workspace-folder $workspacePath --config $configPath $noGitRoot"
     )
     if (result.succeeded) {
+      containerId = containerIdPattern.findFirstMatchIn(result.stdout).map(_.group(1))
       Right(())
     } else {
       Left(s"Failed to start container: ${result.combinedOutput}")
@@ -47,19 +52,28 @@ class DevcontainerRunner(workspaceDir: Path) {
     *
     * TODO: parameterize the mise data volume, use isolated volumes in test, clean those up here
     */
-  def down(): CommandResult = {
-    // The devcontainer CLI doesn't have a down command, so we find and stop the container
+  def down(): CommandResult =
+    // The devcontainer CLI doesn't have a down command, so we stop the container ourselves.
+    // Use the ID from `up` if we have it, to save asking docker to find it again.
+    containerId.orElse(findContainerId()) match {
+      case Some(id) =>
+        val result = CommandRunner.run(s"docker rm -f $id")
+        // the container is gone now, so a repeated `down` should look it up again
+        containerId = None
+        result
+      case None =>
+        // Container might not exist so this isn't necessarily a failure
+        println(s"Warning: Could not find container to stop for workspace: $workspacePath")
+        CommandResult(0, "", "")
+    }
+
+  /** Finds the workspace's container using the label the devcontainer CLI applies to it */
+  private def findContainerId(): Option[String] = {
     val findResult = CommandRunner.run(
       s"""docker ps -q --filter "label=devcontainer.local_folder=$workspacePath""""
     )
-    if (findResult.succeeded && findResult.stdout.trim.nonEmpty) {
-      val containerId = findResult.stdout.trim
-      CommandRunner.run(s"docker rm -f $containerId")
-    } else {
-      // Container might not exist so this isn't necessarily a failure
-      println(s"Warning: Could not find container to stop for workspace: $workspacePath")
-      CommandResult(0, "", "")
-    }
+    if (findResult.succeeded && findResult.stdout.trim.nonEmpty) Some(findResult.stdout.trim)
+    else None
   }
 
 }
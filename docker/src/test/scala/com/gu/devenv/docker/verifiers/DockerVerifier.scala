@@ -10,11 +10,16 @@ import com.gu.devenv.docker.testutils.CommandRunner
 object DockerVerifier {
 
   /** Checks if Docker is installed, running, and working properly.
+    *
+    * The checks are only run once per test JVM, because each one shells out to docker and every
+    * suite verifies Docker before it starts.
     *
     * @return
     *   Right(()) if Docker is available and working, Left(error message) otherwise
     */
-  def verify(): Either[String, Unit] =
+  def verify(): Either[String, Unit] = verification
+
+  private lazy val verification: Either[String, Unit] =
     for {
       _ <- checkDockerInstalled()
       _ <- checkDockerDaemonRunning()